@@ -1,14 +1,27 @@
 import os
 import re
+import sys
 import json
-from datetime import datetime, timedelta
-import pytz
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from vimeo import VimeoClient
+from vimeo.exceptions import APIRateLimitExceededFailure
+
+try:
+    import orjson  # Optional: faster decoding of large API responses
+except ImportError:
+    orjson = None
 
 # Load environment variables from a .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # --- Configuration ---
 # Reads all necessary credentials from your .env file.
 VIMEO_ACCESS_TOKEN = os.environ.get("VIMEO_ACCESS_TOKEN")
@@ -17,10 +30,18 @@ VIMEO_CLIENT_SECRET = os.environ.get("VIMEO_CLIENT_SECRET")
 
 # Timezone for upload date calculations (e.g., 'America/Chicago' for CDT)
 TIMEZONE = "America/Chicago"
+LOCAL_TZ = ZoneInfo(TIMEZONE)
+UTC = timezone.utc
 
 # Time window to check for recent videos (in hours)
 LOOKBACK_HOURS = 72  # Increased to 72 hours for debugging
 
+# Number of videos processed concurrently (keep modest to respect Vimeo rate limits)
+MAX_WORKERS = 8
+
+# Times to retry a request that Vimeo rejects with HTTP 429 (Too Many Requests)
+RATE_LIMIT_RETRIES = 3
+
 # DEBUG MODE: When True, will show metadata for already-processed videos without moving them
 DEBUG_MODE = True
 
@@ -61,9 +82,26 @@ ROOT_CLASS_WINDOWS = {
     },
 }
 
+# The windows above as (name, start_minutes, end_minutes), minutes past midnight
+_SATURDAY_WINDOWS = tuple(
+    (name, w["start"][0] * 60 + w["start"][1], w["end"][0] * 60 + w["end"][1])
+    for name, w in SATURDAY_SERVICE_WINDOW.items()
+)
+_SUNDAY_WINDOWS = tuple(
+    (name, w["start"][0] * 60 + w["start"][1], w["end"][0] * 60 + w["end"][1])
+    for name, w in SUNDAY_SERVICE_WINDOWS.items()
+)
+_ROOT_CLASS_WINDOWS = {
+    day: (w["start"][0] * 60 + w["start"][1], w["end"][0] * 60 + w["end"][1])
+    for day, w in ROOT_CLASS_WINDOWS.items()
+}
+
+# Display names indexed by datetime.weekday() (Monday is 0)
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 # --- Folder Configuration ---
 # List of folder IDs to EXCLUDE from processing. This rule is absolute.
-EXCLUDED_FOLDER_IDS = ["11103430", "182762", "8219992"]
+EXCLUDED_FOLDER_IDS = frozenset({"11103430", "182762", "8219992"})
 
 # Destination folders for categorization
 DESTINATION_FOLDERS = {
@@ -72,6 +110,72 @@ DESTINATION_FOLDERS = {
     "Scott's Classes": "15680946",
     "The Root Class": "10606776",
 }
+# Reverse lookup: destination folder ID -> category name
+_FOLDER_ID_TO_CATEGORY = {v: k for k, v in DESTINATION_FOLDERS.items()}
+
+# Title keywords used for classification, grouped by category
+_ROOT_CLASS_KEYWORDS = ("capture - piro hall", "the root class", "root")
+_WORSHIP_KEYWORDS = ("worship", "contemporary", "traditional")
+_MEMORIAL_KEYWORDS = ("memorial", "wedding")
+_CLASS_KEYWORDS = ("scott", "class")
+
+# Finds every classification keyword in a single pass over the title. The
+# lookahead keeps matches overlapping so e.g. "the root class" still reports
+# "root" and "class" as well.
+_CATEGORY_RE = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(keyword)
+        for keyword in _ROOT_CLASS_KEYWORDS
+        + _WORSHIP_KEYWORDS
+        + _MEMORIAL_KEYWORDS
+        + _CLASS_KEYWORDS
+    )
+    + "))"
+)
+
+# Authenticated user's URI, fetched from /me on first use when not supplied
+_USER_URI = None
+
+# Python 3.11+ parses the trailing "Z" UTC designator natively.
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso(timestamp_str):
+    """Parses a Vimeo ISO 8601 timestamp into an aware datetime."""
+    if _FROMISO_HANDLES_Z:
+        return datetime.fromisoformat(timestamp_str)
+    return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+
+
+def _decode_json(response):
+    """Decodes a response body, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _uri_id(uri):
+    """Returns the trailing ID segment of a Vimeo URI, e.g. '/videos/123' -> '123'."""
+    return uri.rpartition("/")[2]
+
+
+def _strip_date_prefix(title):
+    """
+    Removes the "YYYY-MM-DD - " prefix the script adds to titles, if present.
+    Checks the fixed positions directly instead of running a regex per title.
+    """
+    if (
+        len(title) >= 13
+        and title[4] == "-"
+        and title[7] == "-"
+        and title[10:13] == " - "
+        and title[:4].isdecimal()
+        and title[5:7].isdecimal()
+        and title[8:10].isdecimal()
+    ):
+        return title[13:]
+    return title
 
 
 def get_vimeo_client(token, key, secret):
@@ -80,94 +184,155 @@ def get_vimeo_client(token, key, secret):
     return client
 
 
-def print_video_debug_info(video_data, local_tz, client=None):
+class _ThreadBufferedStream:
+    """
+    Output stream for the log handler while videos are processed concurrently.
+    Worker threads that call start_buffer() have their output collected so it
+    can be printed per video; all other writes go straight to the real stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def start_buffer(self):
+        self._local.buffer = []
+
+    def stop_buffer(self):
+        output = "".join(self._local.buffer)
+        self._local.buffer = None
+        return output
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self.stream.flush()
+
+
+def _call_with_backoff(request, *args, **kwargs):
     """
-    Prints comprehensive debug information about a video's metadata.
+    Calls a Vimeo client request method, retrying with exponential backoff
+    when rate limited. The client raises on HTTP 429 rather than returning it.
     """
-    print("\n" + "=" * 60)
-    print("DEBUG: VIDEO METADATA")
-    print("=" * 60)
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            return request(*args, **kwargs)
+        except APIRateLimitExceededFailure:
+            delay = 2**attempt
+            log.warning("    - Rate limited by Vimeo, retrying in %d seconds...", delay)
+            time.sleep(delay)
+    return request(*args, **kwargs)
 
+
+def print_basic_info(video_data, local_tz):
+    """
+    Logs the metadata already present in the listing response.
+    Makes no API calls. Returns the video's live event data.
+    """
     # Basic info
-    print(f"Title: {video_data.get('name', 'N/A')}")
-    print(f"URI: {video_data.get('uri', 'N/A')}")
-    print(f"Duration: {video_data.get('duration', 0)} seconds")
-    print(f"Is Playable: {video_data.get('is_playable', False)}")
+    log.debug("Title: %s", video_data.get("name", "N/A"))
+    log.debug("URI: %s", video_data.get("uri", "N/A"))
+    log.debug("Duration: %s seconds", video_data.get("duration", 0))
+    log.debug("Is Playable: %s", video_data.get("is_playable", False))
 
     # Timestamps
-    print("\n--- TIMESTAMPS ---")
+    log.debug("\n--- TIMESTAMPS ---")
     for field in ["created_time", "modified_time", "release_time"]:
-        if video_data.get(field):
-            try:
-                dt_utc = datetime.fromisoformat(
-                    video_data[field].replace("Z", "+00:00")
-                )
-                dt_local = dt_utc.astimezone(local_tz)
-                print(f"{field:20s}: {video_data[field]} (UTC)")
-                print(
-                    f"{'':20s}  -> {dt_local.strftime('%Y-%m-%d %I:%M:%S %p %Z')} (Local)"
+        timestamp_str = video_data.get(field)
+        if timestamp_str:
+            # modified_time is already converted by get_recent_videos
+            dt_local = None
+            if field == "modified_time":
+                dt_local = video_data.get("_modified_local")
+            if dt_local is None:
+                dt_utc = _try_parse(timestamp_str)
+                if dt_utc is not None:
+                    dt_local = dt_utc.astimezone(local_tz)
+            if dt_local is None:
+                log.debug("%-20s: %s (parse error)", field, timestamp_str)
+            else:
+                log.debug("%-20s: %s (UTC)", field, timestamp_str)
+                log.debug(
+                    "%20s  -> %s (Local)", "", dt_local.strftime("%Y-%m-%d %I:%M:%S %p %Z")
                 )
-            except:
-                print(f"{field:20s}: {video_data[field]} (parse error)")
         else:
-            print(f"{field:20s}: NOT PRESENT")
+            log.debug("%-20s: NOT PRESENT", field)
 
     # Live event data
-    print("\n--- LIVE EVENT DATA ---")
+    log.debug("\n--- LIVE EVENT DATA ---")
     live_data = video_data.get("live")
     if live_data:
-        print(json.dumps(live_data, indent=2))
+        log.debug("%s", json.dumps(live_data, indent=2))
     else:
-        print("No live event data present")
+        log.debug("No live event data present")
 
-    # Try to fetch full video details for additional fields
-    if client:
-        try:
-            print("\n--- FETCHING FULL VIDEO DETAILS ---")
-            response = client.get(video_data['uri'])
-            if response.status_code == 200:
-                full_data = response.json()
+    return live_data
 
-                # Check for any live-related fields
-                if 'live' in full_data and full_data['live']:
-                    print("Full live event data from detailed fetch:")
-                    print(json.dumps(full_data['live'], indent=2))
 
-                # Check for content rating or tags that might indicate time
-                if 'tags' in full_data:
-                    print(f"\nTags: {full_data.get('tags', [])}")
+def fetch_and_print_full_details(client, video_uri):
+    """
+    Fetches the full video details from the API and logs the additional fields.
+    Costs one extra HTTP request per call.
+    """
+    try:
+        log.debug("\n--- FETCHING FULL VIDEO DETAILS ---")
+        # Only the fields logged below, so the response stays small to decode
+        response = _call_with_backoff(
+            client.get, video_uri, params={"fields": "live,tags,description"}
+        )
+        if response.status_code == 200:
+            full_data = response.json()
 
-                if 'description' in full_data:
-                    print(f"\nDescription: {full_data.get('description', 'N/A')}")
+            # Check for any live-related fields
+            if 'live' in full_data and full_data['live']:
+                log.debug("Full live event data from detailed fetch:")
+                log.debug("%s", json.dumps(full_data['live'], indent=2))
 
-        except Exception as e:
-            print(f"Could not fetch full video details: {e}")
+            # Check for content rating or tags that might indicate time
+            if 'tags' in full_data:
+                log.debug("\nTags: %s", full_data.get('tags', []))
 
-    print("=" * 60 + "\n")
+            if 'description' in full_data:
+                log.debug("\nDescription: %s", full_data.get('description', 'N/A'))
 
-    return live_data
+    except Exception as e:
+        log.debug("Could not fetch full video details: %s", e)
 
 
-def is_time_in_window(dt, start_tuple, end_tuple):
+def print_video_debug_info(video_data, local_tz, client=None):
+    """
+    Logs comprehensive debug information about a video's metadata.
+    The full details are only fetched from the API when a client is given.
     """
-    Check if a datetime falls within a time window.
+    log.debug("\n" + "=" * 60)
+    log.debug("DEBUG: VIDEO METADATA")
+    log.debug("=" * 60)
 
-    Args:
-        dt: datetime object to check
-        start_tuple: (hour, minute) for window start
-        end_tuple: (hour, minute) for window end
+    live_data = print_basic_info(video_data, local_tz)
 
-    Returns:
-        bool: True if time falls within window
-    """
-    start_hour, start_minute = start_tuple
-    end_hour, end_minute = end_tuple
+    # Try to fetch full video details for additional fields
+    if client:
+        fetch_and_print_full_details(client, video_data['uri'])
+
+    log.debug("=" * 60 + "\n")
+
+    return live_data
 
-    time_minutes = dt.hour * 60 + dt.minute
-    start_minutes = start_hour * 60 + start_minute
-    end_minutes = end_hour * 60 + end_minute
 
-    return start_minutes <= time_minutes <= end_minutes
+def _try_parse(timestamp_str):
+    """Parses an ISO timestamp, returning None if it's missing or malformed."""
+    if not timestamp_str:
+        return None
+    try:
+        return _parse_iso(timestamp_str)
+    except ValueError:
+        return None
 
 
 def get_best_timestamp(video_data, local_tz):
@@ -182,26 +347,19 @@ def get_best_timestamp(video_data, local_tz):
         tuple: (datetime in local timezone, source field name)
     """
     # Try release_time first
-    if video_data.get("release_time"):
-        try:
-            dt = datetime.fromisoformat(
-                video_data["release_time"].replace("Z", "+00:00")
-            ).astimezone(local_tz)
-            return (dt, "release_time")
-        except:
-            pass
+    dt = _try_parse(video_data.get("release_time"))
+    if dt:
+        return (dt.astimezone(local_tz), "release_time")
 
     # Use modified_time (most reliable for our use case)
-    if video_data.get("modified_time"):
-        dt = datetime.fromisoformat(
-            video_data["modified_time"].replace("Z", "+00:00")
-        ).astimezone(local_tz)
-        return (dt, "modified_time")
+    if video_data.get("_modified_local"):
+        return (video_data["_modified_local"], "modified_time")
+    dt = _try_parse(video_data.get("modified_time"))
+    if dt:
+        return (dt.astimezone(local_tz), "modified_time")
 
     # Fallback to created_time
-    dt = datetime.fromisoformat(
-        video_data["created_time"].replace("Z", "+00:00")
-    ).astimezone(local_tz)
+    dt = _parse_iso(video_data["created_time"]).astimezone(local_tz)
     return (dt, "created_time")
 
 
@@ -210,48 +368,64 @@ def get_recent_videos(client, lookback_hours):
     print(f"Fetching all videos modified in the last {lookback_hours} hours...")
 
     # Calculate the start time for the lookback window
-    now_utc = datetime.now(pytz.utc)
+    now_utc = datetime.now(UTC)
     start_time_utc = now_utc - timedelta(hours=lookback_hours)
 
     all_recent_videos = []
 
-    try:
-        # Sort by modified_time to find recently finished archives
-        response = client.get(
-            "/me/videos",
-            params={
-                "per_page": 100,
-                "sort": "modified_time",
-                "direction": "desc",
-                "fields": "uri,name,created_time,modified_time,release_time,duration,parent_folder,is_playable,live.status,live.streaming_start_time,live.time,live.scheduled_start_time,live.ended_time,live.archived_time",
-            },
-        )
-        response.raise_for_status()
-
-        videos = response.json().get("data", [])
+    # The live.* subfields are only shown in debug output
+    fields = "uri,name,created_time,modified_time,release_time,duration,parent_folder,is_playable"
+    if DEBUG_MODE:
+        fields += ",live.status,live.streaming_start_time,live.time,live.scheduled_start_time,live.ended_time,live.archived_time"
+
+    # Sort by modified_time to find recently finished archives
+    next_uri = "/me/videos"
+    params = {
+        "per_page": 100,
+        "sort": "modified_time",
+        "direction": "desc",
+        "fields": fields,
+    }
 
-        # DEBUG: Show what fields are being returned for the first video
-        if videos:
-            print("\n" + "=" * 60)
-            print("DEBUG: Sample of fields returned by API (first video)")
-            print("=" * 60)
-            print(f"Available fields: {list(videos[0].keys())}")
-            print("=" * 60 + "\n")
+    try:
+        while next_uri:
+            response = client.get(next_uri, params=params)
+            response.raise_for_status()
+
+            page = _decode_json(response)
+            videos = page.get("data", [])
+
+            # DEBUG: Show what fields are being returned for the first video
+            if videos and not all_recent_videos:
+                log.debug("\n" + "=" * 60)
+                log.debug("DEBUG: Sample of fields returned by API (first video)")
+                log.debug("=" * 60)
+                log.debug("Available fields: %s", list(videos[0].keys()))
+                log.debug("=" * 60 + "\n")
+
+            outside_window = False
+            for video in videos:
+                modified_time_str = video.get("modified_time")
+                if not modified_time_str:
+                    continue
 
-        for video in videos:
-            modified_time_str = video.get("modified_time")
-            if not modified_time_str:
-                continue
+                modified_time_utc = _parse_iso(modified_time_str)
+                if modified_time_utc >= start_time_utc:
+                    # Keep the converted time so later steps don't re-parse it
+                    video["_modified_local"] = modified_time_utc.astimezone(LOCAL_TZ)
+                    all_recent_videos.append(video)
+                else:
+                    # Since the list is sorted, we can stop once we're outside the window.
+                    outside_window = True
+                    break
 
-            modified_time_utc = datetime.fromisoformat(
-                modified_time_str.replace("Z", "+00:00")
-            )
-            if modified_time_utc >= start_time_utc:
-                all_recent_videos.append(video)
-            else:
-                # Since the list is sorted, we can stop once we're outside the window.
+            if outside_window:
                 break
 
+            # The "next" link already carries the original query parameters
+            next_uri = page.get("paging", {}).get("next")
+            params = None
+
     except Exception as e:
         print(f"An error occurred while fetching videos: {e}")
 
@@ -259,7 +433,107 @@ def get_recent_videos(client, lookback_hours):
     return all_recent_videos
 
 
-def process_video(client, video_data, debug_only=False):
+def get_user_uri(client):
+    """Returns the authenticated user's URI, fetching it from /me only once."""
+    global _USER_URI
+    if _USER_URI is None:
+        _USER_URI = _call_with_backoff(client.get, "/me").json()["uri"]
+    return _USER_URI
+
+
+def _classify_root_class(reference_time, t_min, day_of_week, title_keywords, title):
+    """Classifies a Root Class recording by its Monday or Sunday time window."""
+    log.debug("  - Detected 'Root Class' keywords in title")
+
+    # Monday Root Class
+    if day_of_week == 0:  # Monday
+        start_m, end_m = _ROOT_CLASS_WINDOWS["Monday"]
+        if start_m <= t_min <= end_m:
+            log.debug("    → Classified as Monday Root Class")
+            return ("The Root Class", "The Root Class")
+        log.debug("    → Outside Monday Root Class window")
+
+    # Sunday Root Class (overlaps with 9:30 worship, so needs title check)
+    elif day_of_week == 6:  # Sunday
+        start_m, end_m = _ROOT_CLASS_WINDOWS["Sunday"]
+        if start_m <= t_min <= end_m:
+            log.debug("    → Classified as Sunday Root Class (9:30 AM)")
+            return ("The Root Class", "0930 - The Root Class")
+        log.debug("    → Outside Sunday Root Class window")
+
+    return None
+
+
+def _classify_worship(reference_time, t_min, day_of_week, title_keywords, title):
+    """Classifies a worship service by its Saturday or Sunday time window."""
+    log.debug("  - Detected 'Worship Service' keywords in title")
+    service_type = (
+        "Contemporary" if "contemporary" in title_keywords else "Traditional"
+    )
+    log.debug("    → Service type: %s", service_type)
+
+    # Saturday Service
+    if day_of_week == 5:  # Saturday
+        for service_name, start_m, end_m in _SATURDAY_WINDOWS:
+            if start_m <= t_min <= end_m:
+                log.debug("    → Classified as Saturday %s", service_name)
+                return ("Worship Services", f"Worship Service - {service_name}")
+        return None
+
+    # Sunday Services
+    if day_of_week == 6:  # Sunday
+        # Check each Sunday service window
+        for service_time, start_m, end_m in _SUNDAY_WINDOWS:
+            if start_m <= t_min <= end_m:
+                log.debug(
+                    "    → Classified as Sunday %s %s", service_type, service_time
+                )
+                return (
+                    "Worship Services",
+                    f"Worship Service - {service_type} {service_time}",
+                )
+
+        # If no window matched, use fallback logic
+        log.debug(
+            "    → No Sunday window matched for time %s",
+            reference_time.strftime("%I:%M %p"),
+        )
+        log.debug("    → Applying fallback: treating as wedding/memorial")
+        return ("Weddings and Memorials", "Memorial or Wedding Service")
+
+    # Worship service on a non-service day (probably a wedding/memorial)
+    log.debug(
+        "  - 'Worship' title found on a non-service day. Categorizing as 'Weddings and Memorials'."
+    )
+    return ("Weddings and Memorials", "Memorial or Wedding Service")
+
+
+def _classify_memorial(reference_time, t_min, day_of_week, title_keywords, title):
+    """Classifies an explicitly titled memorial or wedding."""
+    log.debug("  - Detected 'Memorial' or 'Wedding' keywords")
+    return ("Weddings and Memorials", "Memorial or Wedding Service")
+
+
+def _classify_scott_class(reference_time, t_min, day_of_week, title_keywords, title):
+    """Classifies one of Scott's classes, keeping its original title."""
+    log.debug("  - Detected 'Scott's Class' keywords")
+    return ("Scott's Classes", title)
+
+
+# Classifiers in precedence order as (title keywords, handler). Each handler
+# returns (category_folder_name, final_title_suffix), or None if unmatched.
+# The Root Class comes first because it is the most specific. Its "root"
+# keyword also keeps "class" titles that mention root from falling through
+# to Scott's Classes.
+_CLASSIFIERS = (
+    (_ROOT_CLASS_KEYWORDS, _classify_root_class),
+    (_WORSHIP_KEYWORDS, _classify_worship),
+    (_MEMORIAL_KEYWORDS, _classify_memorial),
+    (_CLASS_KEYWORDS, _classify_scott_class),
+)
+
+
+def process_video(client, video_data, debug_only=False, user_uri=None):
     """
     Determines the correct title and category, then renames and moves the video if necessary.
     Uses time-window based classification on modified_time for accuracy.
@@ -269,36 +543,41 @@ def process_video(client, video_data, debug_only=False):
         client: Vimeo client instance
         video_data: Video metadata dict
         debug_only: If True, only show debug info without renaming/moving
+        user_uri: URI of the authenticated user; fetched from /me if omitted
     """
     stats = {"title_updated": False, "moved": False}
     current_title = video_data.get("name", "")
-    local_tz = pytz.timezone(TIMEZONE)
+    video_uri = video_data["uri"]
+    duration_seconds = video_data.get("duration", 0) or 0
+    local_tz = LOCAL_TZ
 
     # --- DEBUG: Print all video metadata ---
-    live_data = print_video_debug_info(video_data, local_tz, client)
+    if DEBUG_MODE or debug_only:
+        live_data = print_video_debug_info(video_data, local_tz, client)
+    else:
+        live_data = video_data.get("live")
 
     # If debug_only mode, skip all processing after showing metadata
     if debug_only:
-        print("  - DEBUG MODE: Skipping rename/move operations")
+        log.debug("  - DEBUG MODE: Skipping rename/move operations")
         return stats
 
     # --- 1. Get Best Timestamp for Classification ---
     reference_time, time_source = get_best_timestamp(video_data, local_tz)
-    print(
-        f"  - Using {time_source} for classification: {reference_time.strftime('%Y-%m-%d %I:%M %p')}"
+    log.debug(
+        "  - Using %s for classification: %s",
+        time_source,
+        reference_time.strftime("%Y-%m-%d %I:%M %p"),
     )
 
     # Extract duration if available
-    duration_seconds = video_data.get("duration", 0)
-    duration_minutes = duration_seconds / 60 if duration_seconds else 0
-    if duration_minutes > 0:
-        print(f"  - Video duration: {duration_minutes:.1f} minutes")
+    if duration_seconds and log.isEnabledFor(logging.DEBUG):
+        log.debug("  - Video duration: %.1f minutes", duration_seconds / 60)
 
     # --- 2. Prepare Title for Categorization ---
-    original_title_for_categorization = re.sub(
-        r"^\d{4}-\d{2}-\d{2} - ", "", current_title
-    )
+    original_title_for_categorization = _strip_date_prefix(current_title)
     video_title_lower = original_title_for_categorization.lower()
+    title_keywords = {m.group(1) for m in _CATEGORY_RE.finditer(video_title_lower)}
 
     # --- 3. Determine Service Date ---
     # For most services, the service date is the same as the reference time date
@@ -309,8 +588,8 @@ def process_video(client, video_data, debug_only=False):
     # If we detect a Sunday early morning timestamp (before 6 AM) with worship keywords,
     # it might be a Saturday service that went past midnight
     if day_of_week == 6 and reference_time.hour < 6:  # Sunday before 6 AM
-        if "worship" in video_title_lower or "traditional" in video_title_lower:
-            print(
+        if "worship" in title_keywords or "traditional" in title_keywords:
+            log.debug(
                 "  - Early Sunday morning timestamp detected - checking if this is a late Saturday service"
             )
             # Adjust to previous day (Saturday) for classification
@@ -318,113 +597,33 @@ def process_video(client, video_data, debug_only=False):
             day_of_week = adjusted_time.weekday()
             service_date = adjusted_time.date()
             reference_time = adjusted_time
-            print(f"  - Adjusted to Saturday for classification purposes")
+            log.debug("  - Adjusted to Saturday for classification purposes")
 
     # --- 4. Display Classification Context ---
-    print(
-        f"  - Day of week: {['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][day_of_week]}"
-    )
-    print(f"  - Service date: {service_date.strftime('%Y-%m-%d')}")
-    print(f"  - Title keywords: {video_title_lower[:50]}...")
+    log.debug("  - Day of week: %s", _WEEKDAY_NAMES[day_of_week])
+    log.debug("  - Service date: %s", service_date)
+    log.debug("  - Title keywords: %s...", video_title_lower[:50])
 
-    category_folder_name = None
-    final_title_suffix = None
+    # Minutes past midnight, compared against the precomputed window ranges
+    t_min = reference_time.hour * 60 + reference_time.minute
 
     # --- 5. Classification Logic Using Time Windows ---
-
-    # Check for The Root Class first (more specific)
-    if (
-        "capture - piro hall" in video_title_lower
-        or "the root class" in video_title_lower
-        or "root" in video_title_lower
-    ):
-        print("  - Detected 'Root Class' keywords in title")
-
-        # Monday Root Class
-        if day_of_week == 0:  # Monday
-            window = ROOT_CLASS_WINDOWS["Monday"]
-            if is_time_in_window(reference_time, window["start"], window["end"]):
-                category_folder_name = "The Root Class"
-                final_title_suffix = "The Root Class"
-                print(f"    → Classified as Monday Root Class")
-            else:
-                print(f"    → Outside Monday Root Class window")
-
-        # Sunday Root Class (overlaps with 9:30 worship, so needs title check)
-        elif day_of_week == 6:  # Sunday
-            window = ROOT_CLASS_WINDOWS["Sunday"]
-            if is_time_in_window(reference_time, window["start"], window["end"]):
-                category_folder_name = "The Root Class"
-                final_title_suffix = "0930 - The Root Class"
-                print(f"    → Classified as Sunday Root Class (9:30 AM)")
-            else:
-                print(f"    → Outside Sunday Root Class window")
-
-    # Check for Worship Services
-    elif (
-        "worship" in video_title_lower
-        or "contemporary" in video_title_lower
-        or "traditional" in video_title_lower
-    ):
-        print("  - Detected 'Worship Service' keywords in title")
-        service_type = (
-            "Contemporary" if "contemporary" in video_title_lower else "Traditional"
-        )
-        print(f"    → Service type: {service_type}")
-
-        # Saturday Service
-        if day_of_week == 5:  # Saturday
-            for service_name, window in SATURDAY_SERVICE_WINDOW.items():
-                if is_time_in_window(reference_time, window["start"], window["end"]):
-                    category_folder_name = "Worship Services"
-                    final_title_suffix = f"Worship Service - {service_name}"
-                    print(f"    → Classified as Saturday {service_name}")
-                    break
-
-        # Sunday Services
-        elif day_of_week == 6:  # Sunday
-            # Check each Sunday service window
-            for service_time, window in SUNDAY_SERVICE_WINDOWS.items():
-                if is_time_in_window(reference_time, window["start"], window["end"]):
-                    category_folder_name = "Worship Services"
-                    final_title_suffix = (
-                        f"Worship Service - {service_type} {service_time}"
-                    )
-                    print(f"    → Classified as Sunday {service_type} {service_time}")
-                    break
-
-            # If no window matched, use fallback logic
-            if not category_folder_name:
-                print(
-                    f"    → No Sunday window matched for time {reference_time.strftime('%I:%M %p')}"
-                )
-                print(f"    → Applying fallback: treating as wedding/memorial")
-                category_folder_name = "Weddings and Memorials"
-                final_title_suffix = "Memorial or Wedding Service"
-
-        # Worship service on a non-service day (probably a wedding/memorial)
-        else:
-            print(
-                "  - 'Worship' title found on a non-service day. Categorizing as 'Weddings and Memorials'."
+    # The first classifier whose keywords appear in the title decides the
+    # category, even if its time windows don't match.
+    category_folder_name = None
+    final_title_suffix = None
+    for keywords, classify in _CLASSIFIERS:
+        if not title_keywords.isdisjoint(keywords):
+            result = classify(
+                reference_time,
+                t_min,
+                day_of_week,
+                title_keywords,
+                original_title_for_categorization,
             )
-            category_folder_name = "Weddings and Memorials"
-            final_title_suffix = "Memorial or Wedding Service"
-
-    # Check for explicit Memorial/Wedding keywords
-    elif "memorial" in video_title_lower or "wedding" in video_title_lower:
-        print("  - Detected 'Memorial' or 'Wedding' keywords")
-        category_folder_name = "Weddings and Memorials"
-        final_title_suffix = "Memorial or Wedding Service"
-
-    # Check for Scott's Classes
-    elif "scott" in video_title_lower or (
-        "class" in video_title_lower and "root" not in video_title_lower
-    ):
-        print("  - Detected 'Scott's Class' keywords")
-        category_folder_name = "Scott's Classes"
-        final_title_suffix = (
-            original_title_for_categorization  # Use the original title for classes
-        )
+            if result:
+                category_folder_name, final_title_suffix = result
+            break
 
     # --- 6. Rename and Move ---
     if category_folder_name and final_title_suffix:
@@ -432,51 +631,76 @@ def process_video(client, video_data, debug_only=False):
         correct_date_str = service_date.strftime("%Y-%m-%d")
         new_title = f"{correct_date_str} - {final_title_suffix}"
 
-        print(f"  - Proposed title: '{new_title}'")
+        log.info("  - Proposed title: '%s'", new_title)
 
         # Rename if the current title is not exactly correct
         if current_title != new_title:
-            print(f"  - Updating title to: '{new_title}'")
+            log.info("  - Updating title to: '%s'", new_title)
             try:
-                client.patch(video_data["uri"], data={"name": new_title})
-                print("    - Successfully updated title.")
+                _call_with_backoff(client.patch, video_uri, data={"name": new_title})
+                log.info("    - Successfully updated title.")
                 stats["title_updated"] = True
             except Exception as e:
-                print(f"    - An error occurred while updating title: {e}")
+                log.error("    - An error occurred while updating title: %s", e)
                 return stats
         else:
-            print("  - Skipping rename: Title is already correct.")
+            log.info("  - Skipping rename: Title is already correct.")
 
         # Move to the correct folder
         folder_id = DESTINATION_FOLDERS.get(category_folder_name)
         if folder_id:
-            print(
-                f"  - Moving to folder for '{category_folder_name}' (ID: {folder_id})."
+            log.info(
+                "  - Moving to folder for '%s' (ID: %s).", category_folder_name, folder_id
             )
             try:
-                user_response = client.get("/me")
-                user_uri = user_response.json()["uri"]
+                if user_uri is None:
+                    user_uri = get_user_uri(client)
                 project_uri = f"{user_uri}/projects/{folder_id}"
-                video_uri_id = video_data["uri"].split("/")[-1]
+                video_uri_id = _uri_id(video_uri)
 
-                move_response = client.put(f"{project_uri}/videos/{video_uri_id}")
+                move_response = _call_with_backoff(
+                    client.put, f"{project_uri}/videos/{video_uri_id}"
+                )
                 if move_response.status_code == 204:
-                    print("    - Successfully moved video.")
+                    log.info("    - Successfully moved video.")
                     stats["moved"] = True
                 else:
-                    print(
-                        f"    - Error moving video: {move_response.status_code} - {move_response.text}"
+                    log.error(
+                        "    - Error moving video: %s - %s",
+                        move_response.status_code,
+                        move_response.text,
                     )
             except Exception as e:
-                print(f"    - An error occurred while moving video: {e}")
+                log.error("    - An error occurred while moving video: %s", e)
     else:
-        print("  - No categorization rule matched. Video will not be moved.")
+        log.info("  - No categorization rule matched. Video will not be moved.")
 
     return stats
 
 
+def _process_video_buffered(stream, client, video_data, debug_only, user_uri):
+    """Runs process_video in a worker thread, capturing its log output."""
+    stream.start_buffer()
+    try:
+        stats = process_video(
+            client, video_data, debug_only=debug_only, user_uri=user_uri
+        )
+    finally:
+        output = stream.stop_buffer()
+    return stats, output
+
+
 def main():
     """Main function to run the Vimeo video management script."""
+    # Log records go through a stream that can buffer per worker thread. The
+    # handler and level are set on this module's logger only, so library
+    # loggers (urllib3 etc.) stay quiet as they were before.
+    log_stream = _ThreadBufferedStream(sys.stdout)
+    handler = logging.StreamHandler(log_stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG if DEBUG_MODE else logging.INFO)
+
     print("--- Starting Vimeo Automation Script ---")
 
     if not all([VIMEO_ACCESS_TOKEN, VIMEO_CLIENT_ID, VIMEO_CLIENT_SECRET]):
@@ -494,7 +718,9 @@ def main():
             f"Failed to connect to Vimeo API. Status: {user_response.status_code}, Response: {user_response.json()}"
         )
         return
-    print(f"Successfully connected to Vimeo as: {user_response.json().get('name')}")
+    user_info = user_response.json()
+    user_uri = user_info["uri"]
+    print(f"Successfully connected to Vimeo as: {user_info.get('name')}")
 
     videos_to_check = get_recent_videos(client, LOOKBACK_HOURS)
 
@@ -504,6 +730,9 @@ def main():
     updated_count = 0
     moved_count = 0
 
+    # Videos that pass the rules, as (video, debug_only) pairs
+    to_process = []
+
     if not videos_to_check:
         print("No new videos found to process.")
     else:
@@ -522,7 +751,7 @@ def main():
             parent_folder = video.get("parent_folder")
             parent_folder_id = None
             if parent_folder:
-                parent_folder_id = parent_folder["uri"].split("/")[-1]
+                parent_folder_id = _uri_id(parent_folder["uri"])
 
             # Rule 2: Skip if the video is in an excluded folder.
             if parent_folder_id and parent_folder_id in EXCLUDED_FOLDER_IDS:
@@ -531,7 +760,7 @@ def main():
                         f"  - DEBUG MODE: Checking excluded folder video '{parent_folder.get('name')}' (will not process)."
                     )
                     # Show metadata for excluded videos in debug mode
-                    live_data = print_video_debug_info(video, pytz.timezone(TIMEZONE), client)
+                    live_data = print_video_debug_info(video, LOCAL_TZ, client)
                     continue
                 else:
                     print(
@@ -541,18 +770,18 @@ def main():
 
             # Rule 3: Only process videos in the Team Library (root).
             if parent_folder is not None:
-                if parent_folder_id in DESTINATION_FOLDERS.values():
+                category = _FOLDER_ID_TO_CATEGORY.get(parent_folder_id)
+                if category is not None:
                     if DEBUG_MODE:
                         print(
-                            f"  - DEBUG MODE: Checking already-processed video in '{parent_folder.get('name')}' (will not move/rename)."
+                            f"  - DEBUG MODE: Checking already-processed video in '{category}' (will not move/rename)."
                         )
                         # Process for debug but don't actually move/rename
-                        processed_count += 1
-                        stats = process_video(client, video, debug_only=True)
+                        to_process.append((video, True))
                         continue
                     else:
                         print(
-                            f"  - Skipping: Video is already in a destination folder ('{parent_folder.get('name')}')."
+                            f"  - Skipping: Video is already in a destination folder ('{category}')."
                         )
                         continue
                 else:
@@ -563,12 +792,30 @@ def main():
 
             # If the video passes all checks, process it.
             print("  - Video is valid for processing.")
-            processed_count += 1
-            stats = process_video(client, video)
-            if stats["title_updated"]:
-                updated_count += 1
-            if stats["moved"]:
-                moved_count += 1
+            to_process.append((video, False))
+
+    # --- Process Videos Concurrently ---
+    # The work is network-bound, so threads overlap the API round-trips.
+    # Each video's log output is buffered and printed in order once it's done.
+    if to_process:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda item: _process_video_buffered(
+                    log_stream, client, item[0], item[1], user_uri
+                ),
+                to_process,
+            )
+            for (video, debug_only), (stats, output) in zip(to_process, results):
+                print("\n" + "-" * 20)
+                print(f"Processing video: {video['name']} ({video['uri']})")
+                print(output, end="")
+                processed_count += 1
+                if debug_only:
+                    continue
+                if stats["title_updated"]:
+                    updated_count += 1
+                if stats["moved"]:
+                    moved_count += 1
 
     # --- Print Final Summary ---
     print("\n" + "=" * 30)
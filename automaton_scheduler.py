@@ -20,25 +20,41 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
+import mmap
+import time
 import argparse
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import pytz
-from dotenv import load_dotenv
-from vimeo import VimeoClient
+from zoneinfo import ZoneInfo
 
-# Load environment variables
-load_dotenv()
+try:
+    import ijson  # Optional: stream-parse the schedule file
+except ImportError:
+    ijson = None
 
-# --- Configuration ---
-VIMEO_ACCESS_TOKEN = os.environ.get("VIMEO_ACCESS_TOKEN")
-VIMEO_CLIENT_ID = os.environ.get("VIMEO_CLIENT_ID")
-VIMEO_CLIENT_SECRET = os.environ.get("VIMEO_CLIENT_SECRET")
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
+# --- Configuration ---
+# Vimeo credentials are read from the environment (or .env) by get_vimeo_client()
 TIMEZONE = "America/Chicago"
+LOCAL_TZ = ZoneInfo(TIMEZONE)
 SCHEDULE_FILE = Path(__file__).parent / "schedule_tracker.json"
+# Append-only log of events changed since SCHEDULE_FILE was last written, one
+# {"last_updated": ..., "event": {...}} object per line; see append_events()
+SCHEDULE_JOURNAL_FILE = Path(__file__).parent / "schedule_tracker.jsonl"
+# Fold the journal back into SCHEDULE_FILE once it reaches this share of the
+# tracker's size, so reads can go back to streaming and the index
+SCHEDULE_JOURNAL_COMPACT_RATIO = 0.1
+# Event ID / archived video ID -> position and byte span of the event in the
+# tracker file, written by save_schedule()
+SCHEDULE_INDEX_FILE = Path(__file__).parent / "schedule_index.json"
 
 # --- Test Event Types ---
 # Using generic test nomenclature to avoid confusion with production
@@ -70,6 +86,12 @@ TEST_EVENT_TYPES = {
     },
 }
 
+# Pause for the rate limit window to reset once fewer than this share of the
+# window's requests remain, and never let fewer than RATE_LIMIT_MIN_REMAINING
+# remain. Vimeo bans clients that keep going past the limit.
+RATE_LIMIT_RESERVE = 0.05
+RATE_LIMIT_MIN_REMAINING = 5
+
 # Destination folder IDs (same as automaton.py)
 DESTINATION_FOLDERS = {
     "Worship Services": "15749517",
@@ -78,43 +100,481 @@ DESTINATION_FOLDERS = {
     "The Root Class": "10606776",
 }
 
+# "YYYY-MM-DD - HHMM" prefix produced by create_event_title(). The lookahead
+# lets finditer() report overlapping occurrences within a video name.
+_TITLE_PREFIX_RE = re.compile(r"(?=(\d{4}-\d{2}-\d{2} - \d{4}))")
+
+# A whole create_event_title() title: date, HHMM time and event type
+_EVENT_TITLE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}) - (\d{4}) - (.+)$")
+
+# Metadata JSON embedded by create_classification_metadata(): everything after
+# the marker up to the end of that line or a repeated marker.
+_META_RE = re.compile(r"AUTOMATON_METADATA:\s*(.*?)(?:AUTOMATON_METADATA:|\n|$)")
+
+
+# Shared client for the whole process, created by get_vimeo_client()
+_CLIENT = None
+
+
+def _pooled_vimeo_client_class():
+    """
+    Build the VimeoClient subclass used by get_vimeo_client(). The vimeo and
+    requests imports live here so commands that never call the API don't pay
+    for them at startup.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+    from vimeo import VimeoClient
+    from vimeo.exceptions import APIRateLimitExceededFailure
+
+    class PooledVimeoClient(VimeoClient):
+        """
+        VimeoClient that sends every request through one pooled requests.Session.
+        The stock client calls requests.get() etc. directly, which opens a new
+        connection (and TLS handshake) for every API call.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.3,
+                    # 429 is handled by caller(), which waits for the window to reset
+                    status_forcelist=[500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            )
+            self.session = requests.Session()
+            self.session.mount("https://", adapter)
+            self._me_response = None
+
+        @property
+        def me_response(self):
+            """The /me response, fetched once and reused after it succeeds."""
+            if self._me_response is None or self._me_response.status_code != 200:
+                self._me_response = self.get("/me", params={"fields": "uri,name"})
+            return self._me_response
+
+        @property
+        def me(self):
+            """The authenticated user's /me record."""
+            return self.me_response.json()
+
+        def __getattr__(self, name):
+            """Mirrors VimeoClient's request wrapper, using the pooled session."""
+            if name not in self.HTTP_METHODS:
+                raise AttributeError(f"{name!r} is not an HTTP method")
+
+            def caller(url, jsonify=True, **kwargs):
+                headers = kwargs.get("headers", dict())
+                headers["Accept"] = self.ACCEPT_HEADER
+                headers["User-Agent"] = self.USER_AGENT
+
+                if jsonify and isinstance(kwargs.get("data"), (dict, list)):
+                    kwargs["data"] = json.dumps(kwargs["data"])
+                    headers["Content-Type"] = "application/json"
+
+                kwargs.setdefault("timeout", (1, 30))
+                kwargs.setdefault("auth", self._token)
+                kwargs["headers"] = headers
+                if not url.startswith("http"):
+                    url = self.API_ROOT + url
+
+                response = self.session.request(name, url, **kwargs)
+                if response.status_code == 429:
+                    # Over the limit: wait out the window once, then give up
+                    delay = rate_limit_reset_delay(response)
+                    if delay is None:
+                        raise APIRateLimitExceededFailure(response, "Too many API requests")
+                    print(f"Rate limit exceeded; waiting {delay:.0f}s for it to reset...")
+                    time.sleep(delay)
+                    response = self.session.request(name, url, **kwargs)
+                    if response.status_code == 429:
+                        raise APIRateLimitExceededFailure(response, "Too many API requests")
+                wait_for_rate_limit(response)
+                return response
+
+            return caller
+
+    return PooledVimeoClient
+
 
 def get_vimeo_client():
-    """Initialize and return the Vimeo client."""
-    if not all([VIMEO_ACCESS_TOKEN, VIMEO_CLIENT_ID, VIMEO_CLIENT_SECRET]):
+    """Initialize and return the Vimeo client, shared for the process lifetime."""
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+    access_token = os.environ.get("VIMEO_ACCESS_TOKEN")
+    client_id = os.environ.get("VIMEO_CLIENT_ID")
+    client_secret = os.environ.get("VIMEO_CLIENT_SECRET")
+
+    if not all([access_token, client_id, client_secret]):
         print("ERROR: Vimeo credentials not configured in .env file")
         sys.exit(1)
 
-    return VimeoClient(
-        token=VIMEO_ACCESS_TOKEN,
-        key=VIMEO_CLIENT_ID,
-        secret=VIMEO_CLIENT_SECRET
+    _CLIENT = _pooled_vimeo_client_class()(
+        token=access_token,
+        key=client_id,
+        secret=client_secret
     )
+    return _CLIENT
+
+
+def json_dumps(data, indent=False):
+    """Serialize data to JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def rate_limit_reset_delay(response):
+    """
+    Return the seconds until the rate limit window in the response's
+    X-RateLimit-Reset header resets (0 if already past), or None if the
+    header is missing or unreadable.
+    """
+    reset = response.headers.get("X-RateLimit-Reset")
+    if not reset:
+        return None
+    try:
+        if reset.isdigit():
+            reset_dt = datetime.fromtimestamp(int(reset), timezone.utc)
+        else:
+            reset_dt = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max(0.0, (reset_dt - datetime.now(timezone.utc)).total_seconds())
+
+
+def wait_for_rate_limit(response):
+    """
+    Sleep until Vimeo's rate limit window resets if the response reports that
+    fewer than RATE_LIMIT_RESERVE of the window's requests (and at least
+    RATE_LIMIT_MIN_REMAINING) are left. Called by the pooled client after
+    every request.
+    """
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if not remaining:
+        return
+    try:
+        remaining = int(remaining)
+        limit = int(response.headers.get("X-RateLimit-Limit") or 0)
+    except ValueError:
+        return
+    if remaining >= max(RATE_LIMIT_MIN_REMAINING, limit * RATE_LIMIT_RESERVE):
+        return
+
+    delay = rate_limit_reset_delay(response)
+    if delay:
+        print(f"Rate limit nearly exhausted; waiting {delay:.0f}s for it to reset...")
+        time.sleep(delay)
 
 
 def load_schedule():
-    """Load the schedule tracker JSON file."""
+    """
+    Load the schedule tracker, with any journaled changes applied.
+    The file is memory-mapped so orjson can parse it without first copying
+    it into a separate buffer.
+    """
+    schedule = _load_schedule_snapshot()
+    if _journal_has_entries():
+        _apply_journal(schedule)
+    return schedule
+
+
+def _load_schedule_snapshot():
+    """Load the schedule tracker JSON file as last written by save_schedule()."""
     if SCHEDULE_FILE.exists():
-        with open(SCHEDULE_FILE, 'r') as f:
-            return json.load(f)
+        with open(SCHEDULE_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return default_schedule()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is None:
+                    return json.loads(mm[:])
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    return default_schedule()
+
+
+def default_schedule():
+    """Return an empty schedule tracker structure."""
     return {
         "events": [],
         "last_updated": None,
         "metadata": {
             "version": "1.0",
-            "created": datetime.now(pytz.timezone(TIMEZONE)).isoformat()
+            "created": datetime.now(LOCAL_TZ).isoformat()
         }
     }
 
 
+def _journal_has_entries():
+    """True if there are journaled changes not yet compacted into the tracker."""
+    return SCHEDULE_JOURNAL_FILE.exists() and SCHEDULE_JOURNAL_FILE.stat().st_size > 0
+
+
+def _apply_journal(schedule):
+    """
+    Replay the journal over a loaded tracker. An event replaces the first
+    event with the same ID, or is added at the end if there is none.
+    """
+    events = schedule.setdefault("events", [])
+    positions = {}
+    for position, event in enumerate(events):
+        positions.setdefault(event.get("id"), position)
+
+    with open(SCHEDULE_JOURNAL_FILE, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json_loads(line)
+            except json.JSONDecodeError:
+                # Most likely a write cut short by a crash; later lines still apply
+                print(f"WARNING: Skipping unreadable line {line_number} in {SCHEDULE_JOURNAL_FILE}")
+                continue
+
+            event = record["event"]
+            position = positions.get(event.get("id"))
+            if position is None:
+                positions[event.get("id")] = len(events)
+                events.append(event)
+            else:
+                events[position] = event
+            schedule["last_updated"] = record.get("last_updated")
+
+
+def _can_stream_schedule():
+    """
+    True if the schedule file exists, is non-empty, has no pending journal
+    entries, and ijson is available.
+    """
+    return (
+        ijson is not None
+        and SCHEDULE_FILE.exists()
+        and SCHEDULE_FILE.stat().st_size > 0
+        and not _journal_has_entries()
+    )
+
+
+def iter_events(meta=None):
+    """
+    Yield the tracked events one at a time.
+    With ijson installed the file is streamed, so a caller that stops early
+    never parses the rest of it; otherwise falls back to load_schedule().
+    If meta is a dict, the schedule's last_updated is stored in it by the
+    time the events are exhausted, so the file is only read once.
+    """
+    if not _can_stream_schedule():
+        schedule = load_schedule()
+        if meta is not None and "last_updated" in schedule:
+            meta["last_updated"] = schedule["last_updated"]
+        yield from schedule.get("events", [])
+        return
+    with open(SCHEDULE_FILE, 'rb') as f:
+        if meta is None:
+            yield from ijson.items(f, "events.item", use_float=True)
+        else:
+            yield from _stream_events_with_meta(ijson.parse(f, use_float=True), meta)
+
+
+def _stream_events_with_meta(parse_events, meta):
+    """
+    Build and yield each "events" item from ijson parse events, picking up
+    the top-level last_updated value on the way (it may come before or
+    after the events array).
+    """
+    builder = None
+    for prefix, event, value in parse_events:
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "events.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+        elif prefix == "events.item":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value  # A scalar item
+        elif prefix == "last_updated":
+            meta["last_updated"] = value
+
+
 def save_schedule(schedule_data):
-    """Save the schedule tracker to JSON file."""
-    schedule_data["last_updated"] = datetime.now(pytz.timezone(TIMEZONE)).isoformat()
-    with open(SCHEDULE_FILE, 'w') as f:
-        json.dump(schedule_data, f, indent=2)
+    """
+    Save the whole schedule tracker to JSON file. This folds in any journaled
+    changes, so the journal is cleared afterwards.
+    """
+    schedule_data["last_updated"] = datetime.now(LOCAL_TZ).isoformat()
+    # Write to a temp file and swap it in, so a crash mid-write can't leave
+    # a truncated tracker behind
+    data, spans = _dump_schedule(schedule_data)
+    tmp_file = SCHEDULE_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, SCHEDULE_FILE)
+    SCHEDULE_JOURNAL_FILE.unlink(missing_ok=True)
+    save_schedule_index(schedule_data.get("events", []), spans)
     print(f"Schedule saved to: {SCHEDULE_FILE}")
 
 
+def _dump_schedule(schedule_data):
+    """
+    Serialize the tracker exactly as json_dumps(indent=True) would, and also
+    return the (offset, length) of each event's JSON within the output.
+    """
+    events = schedule_data.get("events")
+    if not events:
+        return json_dumps(schedule_data, indent=True), []
+
+    # Dump everything but the events, then splice them in one at a time,
+    # indented to the depth they sit at in the document
+    outline = json_dumps({**schedule_data, "events": []}, indent=True)
+    marker = b'\n  "events": []'
+    split = outline.index(marker) + len(marker) - 2
+    parts = [outline[:split], b"[\n"]
+    offset = split + 2
+    spans = []
+    for position, event in enumerate(events):
+        if position:
+            parts.append(b",\n")
+            offset += 2
+        event_bytes = b"    " + json_dumps(event, indent=True).replace(b"\n", b"\n    ")
+        parts.append(event_bytes)
+        spans.append((offset + 4, len(event_bytes) - 4))
+        offset += len(event_bytes)
+    parts.append(b"\n  ]")
+    parts.append(outline[split + 2:])
+    return b"".join(parts), spans
+
+
+def save_changed_events(schedule, events):
+    """
+    Persist events that were changed in, or appended to, a schedule returned
+    by load_schedule() (with nothing removed from it).
+
+    The events are journaled only if each has a real ID that occurs exactly
+    once in the schedule, since the journal is replayed by ID. Otherwise, or
+    once the journal is due for compaction, the whole tracker is rewritten.
+    """
+    id_counts = Counter(event.get("id") for event in schedule["events"])
+    can_journal = all(
+        event.get("id") not in (None, "", "unknown") and id_counts[event.get("id")] == 1
+        for event in events
+    )
+    if can_journal and not _journal_needs_compaction():
+        append_events(events)
+    else:
+        save_schedule(schedule)
+
+
+def _journal_needs_compaction():
+    """True if the journal has grown to SCHEDULE_JOURNAL_COMPACT_RATIO of the tracker's size."""
+    if not _journal_has_entries():
+        return False
+    tracker_size = SCHEDULE_FILE.stat().st_size if SCHEDULE_FILE.exists() else 0
+    return SCHEDULE_JOURNAL_FILE.stat().st_size >= tracker_size * SCHEDULE_JOURNAL_COMPACT_RATIO
+
+
+def append_events(events):
+    """
+    Record new or changed events by appending them to the journal, instead of
+    rewriting the whole tracker. Use save_changed_events(), which checks that
+    the journal can represent the change.
+    """
+    last_updated = datetime.now(LOCAL_TZ).isoformat()
+    with open(SCHEDULE_JOURNAL_FILE, 'ab') as f:
+        f.write(b"".join(
+            json_dumps({"last_updated": last_updated, "event": event}) + b"\n"
+            for event in events
+        ))
+    print(f"Schedule saved to: {SCHEDULE_JOURNAL_FILE}")
+
+
+def save_schedule_index(events, spans):
+    """
+    Write the lookup index mapping each event ID and archived video ID to
+    [position, offset, length] of the event in the tracker file. The first
+    event wins, as in a scan of the tracker.
+    """
+    index = {}
+    for position, (event, (offset, length)) in enumerate(zip(events, spans)):
+        for key in (event.get("id"), event.get("archived_video_id")):
+            if key:
+                index.setdefault(key, [position, offset, length])
+
+    tmp_file = SCHEDULE_INDEX_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(json_dumps(index))
+    os.replace(tmp_file, SCHEDULE_INDEX_FILE)
+
+
+def load_schedule_index():
+    """
+    Load the lookup index, or return None if it is missing, unreadable,
+    older than the tracker (e.g. after a hand edit), or out of date because
+    changes have been journaled since it was written.
+    """
+    if _journal_has_entries():
+        return None
+    try:
+        if SCHEDULE_INDEX_FILE.stat().st_mtime < SCHEDULE_FILE.stat().st_mtime:
+            return None
+        with open(SCHEDULE_INDEX_FILE, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def find_event(video_id):
+    """
+    Find the first event whose ID or archived video ID is video_id.
+    Returns (position, event), or (None, None) if there is no such event.
+    """
+    def matches(event):
+        return event.get("archived_video_id") == video_id or event.get("id") == video_id
+
+    index = load_schedule_index()
+    if index is not None:
+        entry = index.get(video_id)
+        if entry is None:
+            return None, None
+        # Read and parse just this event's bytes
+        try:
+            position, offset, length = entry
+            with open(SCHEDULE_FILE, 'rb') as f:
+                f.seek(offset)
+                event = json_loads(f.read(length))
+        except (OSError, TypeError, ValueError):
+            event = None
+        if isinstance(event, dict) and matches(event):
+            return position, event
+
+    # No usable index, so scan and stop at the first match
+    return next(
+        ((position, event) for position, event in enumerate(iter_events()) if matches(event)),
+        (None, None)
+    )
+
+
 def create_classification_metadata(event_type, scheduled_date, scheduled_time):
     """
     Create structured classification metadata for embedding in video description.
@@ -141,12 +601,24 @@ def create_classification_metadata(event_type, scheduled_date, scheduled_time):
         f"Time: {scheduled_time}",
         "",
         "--- CLASSIFICATION METADATA (DO NOT EDIT) ---",
-        f"AUTOMATON_METADATA:{json.dumps(metadata)}"
+        f"AUTOMATON_METADATA:{json_dumps(metadata).decode()}"
     ]
 
     return "\n".join(description_lines), metadata
 
 
+def event_epoch(event):
+    """
+    Return the event's scheduled time as epoch seconds.
+    Uses the cached scheduled_epoch, parsing the ISO string only for events
+    saved before that field existed.
+    """
+    epoch = event.get("scheduled_epoch")
+    if epoch is None:
+        epoch = datetime.fromisoformat(event["scheduled_datetime_iso"]).timestamp()
+    return epoch
+
+
 def create_event_title(event_type, scheduled_date, scheduled_time):
     """
     Create a structured title for the live event.
@@ -156,27 +628,63 @@ def create_event_title(event_type, scheduled_date, scheduled_time):
     return f"{scheduled_date} - {time_formatted} - {event_type}"
 
 
-def cmd_create_event(args):
-    """Create a new Vimeo Live Event with classification metadata."""
-    local_tz = pytz.timezone(TIMEZONE)
+def parse_event_title(title):
+    """
+    Split a title made by create_event_title() back into the (scheduled_date,
+    scheduled_time, event_type) it was built from, or return None.
+    """
+    match = _EVENT_TITLE_RE.match(title)
+    if not match:
+        return None
+    scheduled_date, time_formatted, event_type = match.groups()
+    return scheduled_date, f"{time_formatted[:2]}:{time_formatted[2:]}", event_type
 
-    # Validate event type
-    if args.type not in TEST_EVENT_TYPES:
-        print(f"ERROR: Unknown event type '{args.type}'")
-        print(f"Available types: {', '.join(TEST_EVENT_TYPES.keys())}")
-        sys.exit(1)
 
+def index_events_by_title_prefix(events):
+    """
+    Group events by the "YYYY-MM-DD - HHMM" prefix of their title.
+    Events whose title lacks the prefix are grouped under None.
+    Each group holds (position, event) pairs in schedule order.
+    """
+    title_index = {}
+    for position, event in enumerate(events):
+        title = event.get("title")
+        if not title:
+            continue
+        match = _TITLE_PREFIX_RE.match(title)
+        prefix = match.group(1) if match else None
+        title_index.setdefault(prefix, []).append((position, event))
+    return title_index
+
+
+def find_event_by_title(title_index, video_name):
+    """
+    Return the first event (in schedule order) whose title appears in video_name.
+    Only events sharing a date/time prefix with the name need to be compared.
+    """
+    candidates = list(title_index.get(None, ()))
+    for match in _TITLE_PREFIX_RE.finditer(video_name):
+        candidates.extend(title_index.get(match.group(1), ()))
+
+    matches = [(pos, event) for pos, event in candidates if event["title"] in video_name]
+    if not matches:
+        return None
+    return min(matches, key=lambda m: m[0])[1]
+
+
+def cmd_create_event(args):
+    """Create a new Vimeo Live Event with classification metadata."""
     # Parse and validate date/time
     try:
         scheduled_dt = datetime.strptime(f"{args.date} {args.time}", "%Y-%m-%d %H:%M")
-        scheduled_dt = local_tz.localize(scheduled_dt)
+        scheduled_dt = scheduled_dt.replace(tzinfo=LOCAL_TZ)
     except ValueError as e:
         print(f"ERROR: Invalid date/time format: {e}")
         print("Expected: --date YYYY-MM-DD --time HH:MM")
         sys.exit(1)
 
     # Check if event is in the future
-    now = datetime.now(local_tz)
+    now = datetime.now(LOCAL_TZ)
     if scheduled_dt < now and not args.force:
         print(f"WARNING: Scheduled time {scheduled_dt} is in the past!")
         print("Use --force to create anyway (for testing)")
@@ -206,7 +714,7 @@ def cmd_create_event(args):
     client = get_vimeo_client()
 
     # Verify connection
-    user_response = client.get("/me")
+    user_response = client.me_response
     if user_response.status_code != 200:
         print(f"ERROR: Failed to connect to Vimeo API: {user_response.status_code}")
         sys.exit(1)
@@ -250,8 +758,7 @@ def cmd_create_event(args):
                 print(f"  RTMP URL: {event_response['rtmp_link']}")
 
             # Save to schedule tracker
-            schedule = load_schedule()
-            schedule["events"].append({
+            new_event = {
                 "id": event_id,
                 "uri": event_uri,
                 "event_type": args.type,
@@ -259,14 +766,17 @@ def cmd_create_event(args):
                 "scheduled_date": args.date,
                 "scheduled_time": args.time,
                 "scheduled_datetime_iso": scheduled_dt.isoformat(),
+                "scheduled_epoch": scheduled_dt.timestamp(),
                 "folder_destination": TEST_EVENT_TYPES[args.type]["folder_destination"],
                 "status": "scheduled",
-                "created_at": datetime.now(local_tz).isoformat(),
+                "created_at": datetime.now(LOCAL_TZ).isoformat(),
                 "archived_video_id": None,  # Will be filled when video is archived
                 "classification_complete": False,
                 "metadata": metadata
-            })
-            save_schedule(schedule)
+            }
+            schedule = load_schedule()
+            schedule["events"].append(new_event)
+            save_changed_events(schedule, [new_event])
 
         else:
             print(f"ERROR: Failed to create live event")
@@ -288,18 +798,10 @@ def cmd_register_event(args):
     Register an existing Vimeo Live Event that was created manually.
     This allows tracking events created through the Vimeo web interface.
     """
-    local_tz = pytz.timezone(TIMEZONE)
-
-    # Validate event type
-    if args.type not in TEST_EVENT_TYPES:
-        print(f"ERROR: Unknown event type '{args.type}'")
-        print(f"Available types: {', '.join(TEST_EVENT_TYPES.keys())}")
-        sys.exit(1)
-
     # Parse date/time
     try:
         scheduled_dt = datetime.strptime(f"{args.date} {args.time}", "%Y-%m-%d %H:%M")
-        scheduled_dt = local_tz.localize(scheduled_dt)
+        scheduled_dt = scheduled_dt.replace(tzinfo=LOCAL_TZ)
     except ValueError as e:
         print(f"ERROR: Invalid date/time format: {e}")
         sys.exit(1)
@@ -322,7 +824,7 @@ def cmd_register_event(args):
     # Optionally verify the event exists in Vimeo
     if not args.skip_verify:
         client = get_vimeo_client()
-        response = client.get(f"/videos/{args.event_id}")
+        response = client.get(f"/videos/{args.event_id}", params={"fields": "name"})
         if response.status_code == 200:
             video_data = response.json()
             print(f"Verified: Found video '{video_data.get('name')}'")
@@ -336,6 +838,7 @@ def cmd_register_event(args):
     schedule = load_schedule()
 
     # Check for duplicate
+    replaced = False
     for event in schedule["events"]:
         if event.get("id") == args.event_id:
             print(f"WARNING: Event {args.event_id} already registered")
@@ -344,8 +847,9 @@ def cmd_register_event(args):
                 sys.exit(1)
             # Remove existing entry
             schedule["events"] = [e for e in schedule["events"] if e.get("id") != args.event_id]
+            replaced = True
 
-    schedule["events"].append({
+    new_event = {
         "id": args.event_id,
         "uri": f"/videos/{args.event_id}",
         "event_type": args.type,
@@ -353,72 +857,78 @@ def cmd_register_event(args):
         "scheduled_date": args.date,
         "scheduled_time": args.time,
         "scheduled_datetime_iso": scheduled_dt.isoformat(),
+        "scheduled_epoch": scheduled_dt.timestamp(),
         "folder_destination": TEST_EVENT_TYPES[args.type]["folder_destination"],
         "status": "registered",
-        "created_at": datetime.now(local_tz).isoformat(),
+        "created_at": datetime.now(LOCAL_TZ).isoformat(),
         "archived_video_id": args.event_id,  # For manually registered events, this is the same
         "classification_complete": False,
         "metadata": metadata,
         "manually_registered": True
-    })
-    save_schedule(schedule)
+    }
+    schedule["events"].append(new_event)
+    if replaced:
+        # Duplicates were dropped, which the journal can't express
+        save_schedule(schedule)
+    else:
+        save_changed_events(schedule, [new_event])
     print("Event registered successfully!")
 
 
 def cmd_list_events(args):
     """List all tracked events."""
-    schedule = load_schedule()
-    events = schedule.get("events", [])
-
-    if not events:
+    now_ts = datetime.now(LOCAL_TZ).timestamp()
+
+    # Filter while streaming so only the requested events are kept, each
+    # paired with its scheduled time for sorting and display
+    total_events = 0
+    events = []
+    meta = {}
+    for event in iter_events(meta):
+        total_events += 1
+        # Filter by status if requested
+        if args.status and event.get("status") != args.status:
+            continue
+        scheduled_ts = event_epoch(event)
+        # Filter upcoming only
+        if args.upcoming and scheduled_ts <= now_ts:
+            continue
+        events.append((scheduled_ts, event))
+
+    if not total_events:
         print("No events in schedule tracker.")
         print(f"Schedule file: {SCHEDULE_FILE}")
         return
 
-    local_tz = pytz.timezone(TIMEZONE)
-    now = datetime.now(local_tz)
-
-    # Sort events by scheduled datetime
-    events_sorted = sorted(
-        events,
-        key=lambda e: e.get("scheduled_datetime_iso", ""),
-        reverse=True
-    )
-
-    # Filter by status if requested
-    if args.status:
-        events_sorted = [e for e in events_sorted if e.get("status") == args.status]
-
-    # Filter upcoming only
-    if args.upcoming:
-        events_sorted = [
-            e for e in events_sorted
-            if datetime.fromisoformat(e["scheduled_datetime_iso"]) > now
-        ]
+    # Sort events by scheduled time, newest first
+    events.sort(key=lambda pair: pair[0], reverse=True)
 
-    print("\n" + "=" * 80)
-    print(f"SCHEDULED EVENTS ({len(events_sorted)} events)")
-    print("=" * 80)
+    # Output lines are buffered and written with one call after the footer
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append(f"SCHEDULED EVENTS ({len(events)} events)")
+    lines.append("=" * 80)
 
-    for event in events_sorted:
-        scheduled_dt = datetime.fromisoformat(event["scheduled_datetime_iso"])
-        is_past = scheduled_dt < now
+    for scheduled_ts, event in events:
+        is_past = scheduled_ts < now_ts
         status_icon = "[PAST]" if is_past else "[UPCOMING]"
         classified_icon = "[CLASSIFIED]" if event.get("classification_complete") else ""
 
-        print(f"\n{status_icon} {classified_icon}")
-        print(f"  ID:        {event.get('id', 'N/A')}")
-        print(f"  Type:      {event.get('event_type', 'N/A')}")
-        print(f"  Title:     {event.get('title', 'N/A')}")
-        print(f"  Scheduled: {scheduled_dt.strftime('%Y-%m-%d %I:%M %p %Z')}")
-        print(f"  Folder:    {event.get('folder_destination', 'N/A')}")
-        print(f"  Status:    {event.get('status', 'N/A')}")
+        lines.append(f"\n{status_icon} {classified_icon}")
+        lines.append(f"  ID:        {event.get('id', 'N/A')}")
+        lines.append(f"  Type:      {event.get('event_type', 'N/A')}")
+        lines.append(f"  Title:     {event.get('title', 'N/A')}")
+        scheduled_dt = datetime.fromtimestamp(scheduled_ts, LOCAL_TZ)
+        lines.append(f"  Scheduled: {scheduled_dt.strftime('%Y-%m-%d %I:%M %p %Z')}")
+        lines.append(f"  Folder:    {event.get('folder_destination', 'N/A')}")
+        lines.append(f"  Status:    {event.get('status', 'N/A')}")
         if event.get("archived_video_id"):
-            print(f"  Video ID:  {event.get('archived_video_id')}")
+            lines.append(f"  Video ID:  {event.get('archived_video_id')}")
 
-    print("\n" + "=" * 80)
-    print(f"Schedule file: {SCHEDULE_FILE}")
-    print(f"Last updated: {schedule.get('last_updated', 'Never')}")
+    lines.append("\n" + "=" * 80)
+    lines.append(f"Schedule file: {SCHEDULE_FILE}")
+    lines.append(f"Last updated: {meta.get('last_updated', 'Never')}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_list_types(args):
@@ -436,12 +946,36 @@ def cmd_list_types(args):
     print("\n" + "=" * 60)
 
 
+def fetch_videos_bulk(client, video_uris, fields):
+    """
+    Fetch the given fields (which must include uri) for many videos with one
+    request per 100 URIs. Returns a dict of video URI -> video data; missing
+    videos are omitted.
+    """
+    videos_by_uri = {}
+    for start in range(0, len(video_uris), 100):
+        batch = video_uris[start:start + 100]
+        response = client.get(
+            "/videos",
+            params={
+                "uris": ",".join(batch),
+                "fields": fields,
+                "per_page": 100,
+            },
+        )
+        if response.status_code != 200:
+            print(f"WARNING: Bulk query failed with status {response.status_code}")
+            continue
+        for video in response.json().get("data", []):
+            videos_by_uri[video["uri"]] = video
+    return videos_by_uri
+
+
 def cmd_match_videos(args):
     """
     Attempt to match recent Vimeo videos to scheduled events.
     This helps identify which archived videos correspond to which events.
     """
-    local_tz = pytz.timezone(TIMEZONE)
     schedule = load_schedule()
     events = schedule.get("events", [])
 
@@ -452,7 +986,7 @@ def cmd_match_videos(args):
     client = get_vimeo_client()
 
     # Verify connection
-    user_response = client.get("/me")
+    user_response = client.me_response
     if user_response.status_code != 200:
         print(f"ERROR: Failed to connect to Vimeo API")
         sys.exit(1)
@@ -462,82 +996,134 @@ def cmd_match_videos(args):
     lookback_hours = args.hours or 72
     print(f"\nFetching videos from the last {lookback_hours} hours...")
 
-    now_utc = datetime.now(pytz.utc)
+    now_utc = datetime.now(timezone.utc)
     start_time_utc = now_utc - timedelta(hours=lookback_hours)
 
-    response = client.get(
-        "/me/videos",
-        params={
-            "per_page": 50,
-            "sort": "modified_time",
-            "direction": "desc",
-            "fields": "uri,name,created_time,modified_time,duration,description,live"
-        }
-    )
+    # Page through /me/videos, newest modification first, until a video falls
+    # before start_time_utc
+    videos = []
+    next_uri = "/me/videos"
+    params = {
+        "per_page": 100,
+        "sort": "modified_time",
+        "direction": "desc",
+        "fields": "uri,name,modified_time"
+    }
 
-    if response.status_code != 200:
-        print(f"ERROR: Failed to fetch videos: {response.status_code}")
-        return
+    while next_uri:
+        response = client.get(next_uri, params=params)
+        if response.status_code != 200:
+            print(f"ERROR: Failed to fetch videos: {response.status_code}")
+            if not videos:
+                return
+            break
+
+        page = response.json()
+        reached_cutoff = False
+        for video in page.get("data", []):
+            modified_time_str = video.get("modified_time")
+            if modified_time_str and datetime.fromisoformat(
+                modified_time_str.replace("Z", "+00:00")
+            ) < start_time_utc:
+                reached_cutoff = True
+                break
+            videos.append(video)
+
+        if reached_cutoff:
+            break
+        next_uri = page.get("paging", {}).get("next")
+        params = None  # paging.next is a full query string
 
-    videos = response.json().get("data", [])
     print(f"Found {len(videos)} recent videos")
 
-    print("\n" + "=" * 80)
-    print("MATCHING VIDEOS TO SCHEDULED EVENTS")
-    print("=" * 80)
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("MATCHING VIDEOS TO SCHEDULED EVENTS")
+    lines.append("=" * 80)
 
     matched_count = 0
+    # Linked events, keyed by object identity so each is journaled once
+    changed_events = {}
+
+    # Index events once so each video is matched with dict lookups
+    by_key = {}
+    for event in events:
+        key = (event.get("scheduled_date"), event.get("scheduled_time"), event.get("event_type"))
+        by_key.setdefault(key, event)  # First event wins, as in schedule order
+    title_index = index_events_by_title_prefix(events)
+
+    # A title made by create_event_title() names its event outright; only the
+    # other videos need their descriptions fetched to look for metadata
+    title_keys = {video["uri"]: parse_event_title(video.get("name") or "") for video in videos}
+    needs_description = [uri for uri, key in title_keys.items() if key is None or key not in by_key]
+    described = fetch_videos_bulk(client, needs_description, "uri,description") if needs_description else {}
 
     for video in videos:
         video_id = video["uri"].split("/")[-1]
         video_name = video.get("name", "Unknown")
-        description = video.get("description", "") or ""
+
+        title_key = title_keys[video["uri"]]
+        event = by_key.get(title_key) if title_key is not None else None
+        if event is not None:
+            lines.append(f"\n[TITLE MATCH] Video: {video_name}")
+            lines.append(f"  Video ID: {video_id}")
+            lines.append(f"  Matched Event: {event.get('event_type')}")
+
+            if not event.get("archived_video_id"):
+                event["archived_video_id"] = video_id
+                event["status"] = "archived"
+                changed_events[id(event)] = event
+                matched_count += 1
+            continue
+
+        description = described.get(video["uri"], {}).get("description") or ""
 
         # Check if description contains our metadata marker
-        if "AUTOMATON_METADATA:" in description:
+        metadata_match = _META_RE.search(description)
+        if metadata_match:
             try:
-                metadata_str = description.split("AUTOMATON_METADATA:")[1].strip()
-                # Handle potential extra content after JSON
-                if "\n" in metadata_str:
-                    metadata_str = metadata_str.split("\n")[0]
-                embedded_metadata = json.loads(metadata_str)
+                embedded_metadata = json_loads(metadata_match.group(1))
 
-                print(f"\n[MATCH FOUND] Video: {video_name}")
-                print(f"  Video ID: {video_id}")
-                print(f"  Embedded Type: {embedded_metadata.get('classification', {}).get('event_type')}")
-                print(f"  Embedded Date: {embedded_metadata.get('classification', {}).get('scheduled_date')}")
+                lines.append(f"\n[MATCH FOUND] Video: {video_name}")
+                lines.append(f"  Video ID: {video_id}")
+                lines.append(f"  Embedded Type: {embedded_metadata.get('classification', {}).get('event_type')}")
+                lines.append(f"  Embedded Date: {embedded_metadata.get('classification', {}).get('scheduled_date')}")
 
                 # Update schedule tracker
-                for event in events:
-                    if (event.get("scheduled_date") == embedded_metadata.get("classification", {}).get("scheduled_date") and
-                        event.get("scheduled_time") == embedded_metadata.get("classification", {}).get("scheduled_time") and
-                        event.get("event_type") == embedded_metadata.get("classification", {}).get("event_type")):
-
-                        event["archived_video_id"] = video_id
-                        event["status"] = "archived"
-                        print(f"  -> Linked to scheduled event!")
-                        matched_count += 1
-                        break
+                classification = embedded_metadata.get("classification", {})
+                event = by_key.get((
+                    classification.get("scheduled_date"),
+                    classification.get("scheduled_time"),
+                    classification.get("event_type"),
+                ))
+                if event is not None:
+                    event["archived_video_id"] = video_id
+                    event["status"] = "archived"
+                    changed_events[id(event)] = event
+                    lines.append(f"  -> Linked to scheduled event!")
+                    matched_count += 1
+
+            except json.JSONDecodeError as e:
+                lines.append(f"  Warning: Could not parse embedded metadata: {e}")
+
+        # Also try matching by the title's date/time prefix
+        else:
+            event = find_event_by_title(title_index, video_name)
+            if event is not None:
+                lines.append(f"\n[TITLE MATCH] Video: {video_name}")
+                lines.append(f"  Video ID: {video_id}")
+                lines.append(f"  Matched Event: {event.get('event_type')}")
 
-            except (json.JSONDecodeError, IndexError) as e:
-                print(f"  Warning: Could not parse embedded metadata: {e}")
+                if not event.get("archived_video_id"):
+                    event["archived_video_id"] = video_id
+                    event["status"] = "archived"
+                    changed_events[id(event)] = event
+                    matched_count += 1
 
-        # Also try matching by title pattern
-        else:
-            for event in events:
-                if event.get("title") and event["title"] in video_name:
-                    print(f"\n[TITLE MATCH] Video: {video_name}")
-                    print(f"  Video ID: {video_id}")
-                    print(f"  Matched Event: {event.get('event_type')}")
-
-                    if not event.get("archived_video_id"):
-                        event["archived_video_id"] = video_id
-                        event["status"] = "archived"
-                        matched_count += 1
-                    break
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if matched_count > 0:
-        save_schedule(schedule)
+        save_changed_events(schedule, list(changed_events.values()))
         print(f"\n{matched_count} videos matched and linked to scheduled events.")
     else:
         print("\nNo new matches found.")
@@ -548,29 +1134,22 @@ def cmd_classify(args):
     Classify a video using the schedule tracker data.
     This is the classification logic that uses scheduled event data instead of time windows.
     """
-    schedule = load_schedule()
-    events = schedule.get("events", [])
-
-    # Find the event for this video
-    matching_event = None
-    for event in events:
-        if event.get("archived_video_id") == args.video_id or event.get("id") == args.video_id:
-            matching_event = event
-            break
+    event_position, matching_event = find_event(args.video_id)
 
     if not matching_event:
         print(f"No scheduled event found for video ID: {args.video_id}")
         print("You may need to run 'match-videos' first, or 'register' this event manually.")
         return
 
-    print("\n" + "=" * 60)
-    print("CLASSIFICATION RESULT")
-    print("=" * 60)
-    print(f"Video ID:     {args.video_id}")
-    print(f"Event Type:   {matching_event.get('event_type')}")
-    print(f"Service Date: {matching_event.get('scheduled_date')}")
-    print(f"Service Time: {matching_event.get('scheduled_time')}")
-    print(f"Destination:  {matching_event.get('folder_destination')}")
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("CLASSIFICATION RESULT")
+    lines.append("=" * 60)
+    lines.append(f"Video ID:     {args.video_id}")
+    lines.append(f"Event Type:   {matching_event.get('event_type')}")
+    lines.append(f"Service Date: {matching_event.get('scheduled_date')}")
+    lines.append(f"Service Time: {matching_event.get('scheduled_time')}")
+    lines.append(f"Destination:  {matching_event.get('folder_destination')}")
 
     # Generate the correct title
     event_type = matching_event.get("event_type", "Unknown")
@@ -578,13 +1157,14 @@ def cmd_classify(args):
     time = matching_event.get("scheduled_time", "00:00").replace(":", "")
 
     correct_title = f"{date} - {time} - {event_type}"
-    print(f"Correct Title: {correct_title}")
+    lines.append(f"Correct Title: {correct_title}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if args.apply:
         client = get_vimeo_client()
 
         # Get current video info
-        response = client.get(f"/videos/{args.video_id}")
+        response = client.get(f"/videos/{args.video_id}", params={"fields": "name"})
         if response.status_code != 200:
             print(f"ERROR: Could not fetch video: {response.status_code}")
             return
@@ -608,8 +1188,7 @@ def cmd_classify(args):
 
         if folder_id:
             print(f"\nMoving to folder: {folder_name} (ID: {folder_id})")
-            user_response = client.get("/me")
-            user_uri = user_response.json()["uri"]
+            user_uri = client.me["uri"]
             project_uri = f"{user_uri}/projects/{folder_id}"
 
             move_response = client.put(f"{project_uri}/videos/{args.video_id}")
@@ -617,15 +1196,30 @@ def cmd_classify(args):
                 print("Video moved successfully!")
 
                 # Update schedule tracker
-                matching_event["classification_complete"] = True
-                matching_event["status"] = "classified"
-                save_schedule(schedule)
+                schedule = load_schedule()
+                event = schedule["events"][event_position]
+                event["classification_complete"] = True
+                event["status"] = "classified"
+                save_changed_events(schedule, [event])
             else:
                 print(f"ERROR: Failed to move video: {move_response.status_code}")
     else:
         print("\nUse --apply to actually rename and move the video.")
 
 
+def cmd_compact(args):
+    """Fold the journal of event changes back into the schedule tracker file."""
+    if not _journal_has_entries():
+        print("Nothing to compact; the schedule tracker is up to date.")
+        return
+
+    with open(SCHEDULE_JOURNAL_FILE, 'rb') as f:
+        journal_entries = sum(1 for line in f if line.strip())
+    schedule = load_schedule()
+    save_schedule(schedule)
+    print(f"Compacted {journal_entries} journal entries ({len(schedule['events'])} events tracked).")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Vimeo Live Event Scheduler and Tracker",
@@ -649,6 +1243,9 @@ Examples:
 
   # Classify a specific video
   python3 automaton_scheduler.py classify --video-id 123456789 --apply
+
+  # Fold journaled changes back into the schedule tracker file
+  python3 automaton_scheduler.py compact
         """
     )
 
@@ -656,53 +1253,55 @@ Examples:
 
     # Create event command
     create_parser = subparsers.add_parser("create", help="Create a new Vimeo Live Event")
-    create_parser.add_argument("--type", required=True, help="Event type (use 'list-types' to see options)")
+    create_parser.add_argument("--type", required=True, choices=list(TEST_EVENT_TYPES), metavar="TYPE",
+                               help="Event type (use 'list-types' to see options)")
     create_parser.add_argument("--date", required=True, help="Event date (YYYY-MM-DD)")
     create_parser.add_argument("--time", required=True, help="Event time (HH:MM)")
     create_parser.add_argument("--dry-run", action="store_true", help="Preview without creating")
     create_parser.add_argument("--force", action="store_true", help="Force creation even if date is in past")
+    create_parser.set_defaults(func=cmd_create_event)
 
     # Register existing event command
     register_parser = subparsers.add_parser("register", help="Register an existing Vimeo event")
     register_parser.add_argument("--event-id", required=True, help="Vimeo video/event ID")
-    register_parser.add_argument("--type", required=True, help="Event type")
+    register_parser.add_argument("--type", required=True, choices=list(TEST_EVENT_TYPES), metavar="TYPE",
+                                 help="Event type")
     register_parser.add_argument("--date", required=True, help="Event date (YYYY-MM-DD)")
     register_parser.add_argument("--time", required=True, help="Event time (HH:MM)")
     register_parser.add_argument("--dry-run", action="store_true", help="Preview without registering")
     register_parser.add_argument("--force", action="store_true", help="Force registration even if duplicate")
     register_parser.add_argument("--skip-verify", action="store_true", help="Skip verification of event ID")
+    register_parser.set_defaults(func=cmd_register_event)
 
     # List events command
     list_parser = subparsers.add_parser("list", help="List tracked events")
     list_parser.add_argument("--status", help="Filter by status (scheduled, archived, classified)")
     list_parser.add_argument("--upcoming", action="store_true", help="Show only upcoming events")
+    list_parser.set_defaults(func=cmd_list_events)
 
     # List types command
-    subparsers.add_parser("list-types", help="List available event types")
+    list_types_parser = subparsers.add_parser("list-types", help="List available event types")
+    list_types_parser.set_defaults(func=cmd_list_types)
 
     # Match videos command
     match_parser = subparsers.add_parser("match-videos", help="Match recent videos to scheduled events")
     match_parser.add_argument("--hours", type=int, default=72, help="Hours to look back (default: 72)")
+    match_parser.set_defaults(func=cmd_match_videos)
 
     # Classify command
     classify_parser = subparsers.add_parser("classify", help="Classify a video using schedule data")
     classify_parser.add_argument("--video-id", required=True, help="Video ID to classify")
     classify_parser.add_argument("--apply", action="store_true", help="Actually rename and move the video")
+    classify_parser.set_defaults(func=cmd_classify)
+
+    # Compact command
+    compact_parser = subparsers.add_parser("compact", help="Fold journaled changes into the schedule tracker file")
+    compact_parser.set_defaults(func=cmd_compact)
 
     args = parser.parse_args()
 
-    if args.command == "create":
-        cmd_create_event(args)
-    elif args.command == "register":
-        cmd_register_event(args)
-    elif args.command == "list":
-        cmd_list_events(args)
-    elif args.command == "list-types":
-        cmd_list_types(args)
-    elif args.command == "match-videos":
-        cmd_match_videos(args)
-    elif args.command == "classify":
-        cmd_classify(args)
+    if hasattr(args, "func"):
+        args.func(args)
     else:
         parser.print_help()
 
@@ -1,45 +1,61 @@
 #!/usr/bin/env python3
 """
-Simple script to query Vimeo API and get full metadata for specific videos.
+Simple script to query Vimeo API and get the metadata for specific videos.
 Usage: python3 query_video.py VIDEO_ID [VIDEO_ID ...]
 Example: python3 query_video.py 1137434285 1137326065
 """
 
-import os
 import sys
 import json
-from dotenv import load_dotenv
-from vimeo import VimeoClient
+from concurrent.futures import ThreadPoolExecutor
+from automaton_scheduler import fetch_videos_bulk, get_vimeo_client
 
-# Load environment variables
-load_dotenv()
+# Fields requested for each video. Vimeo counts a call without a fields
+# filter as several requests against the rate limit, and the response is
+# far larger.
+VIDEO_FIELDS = "uri,name,description,duration,created_time,modified_time,live,privacy"
 
-VIMEO_ACCESS_TOKEN = os.environ.get("VIMEO_ACCESS_TOKEN")
-VIMEO_CLIENT_ID = os.environ.get("VIMEO_CLIENT_ID")
-VIMEO_CLIENT_SECRET = os.environ.get("VIMEO_CLIENT_SECRET")
+# Concurrent direct lookups; kept below the pooled client's pool_maxsize (16)
+# so no worker waits on a connection.
+MAX_WORKERS = 8
 
-def query_video(client, video_id):
-    """Query full metadata for a video ID."""
+def video_uri_for(video_id):
+    """Return the API URI for a video ID (or pass an existing URI through)."""
+    return f"/videos/{video_id}" if not video_id.startswith('/') else video_id
+
+def fetch_video(client, video_id):
+    """Fetch the metadata for a video ID. Returns the response, or the exception raised."""
     try:
-        # Construct the URI
-        video_uri = f"/videos/{video_id}" if not video_id.startswith('/') else video_id
+        return client.get(video_uri_for(video_id), params={"fields": VIDEO_FIELDS})
+    except Exception as e:
+        return e
 
-        print(f"\n{'='*80}")
-        print(f"Querying video: {video_id}")
-        print('='*80)
+def print_video_result(video_id, result):
+    """Print a fetch_video() result."""
+    print(f"\n{'='*80}")
+    print(f"Querying video: {video_id}")
+    print('='*80)
 
-        # Fetch the video with all available fields
-        response = client.get(video_uri)
+    if isinstance(result, Exception):
+        print(f"ERROR querying video {video_id}: {result}")
+    elif result.status_code == 200:
+        data = result.json()
+        print(json.dumps(data, indent=2))
+    else:
+        print(f"ERROR: Status {result.status_code}")
+        print(result.text)
 
-        if response.status_code == 200:
-            data = response.json()
-            print(json.dumps(data, indent=2))
-        else:
-            print(f"ERROR: Status {response.status_code}")
-            print(response.text)
+def query_video(client, video_id):
+    """Query the metadata for a video ID."""
+    print_video_result(video_id, fetch_video(client, video_id))
 
-    except Exception as e:
-        print(f"ERROR querying video {video_id}: {e}")
+def query_videos_bulk(client, video_ids):
+    """
+    Fetch metadata for many videos with one request per 100 IDs.
+    Returns a dict of video URI -> video data; missing videos are omitted.
+    """
+    uris = [video_uri_for(video_id) for video_id in video_ids]
+    return fetch_videos_bulk(client, uris, VIDEO_FIELDS)
 
 def main():
     if len(sys.argv) < 2:
@@ -49,16 +65,12 @@ def main():
         print("  python3 query_video.py 1137434285 1137326065 1137436717")
         sys.exit(1)
 
-    # Initialize Vimeo client
-    client = VimeoClient(
-        token=VIMEO_ACCESS_TOKEN,
-        key=VIMEO_CLIENT_ID,
-        secret=VIMEO_CLIENT_SECRET
-    )
+    # Initialize Vimeo client (one pooled connection reused for every query)
+    client = get_vimeo_client()
 
     # Test connection
     try:
-        user_response = client.get("/me")
+        user_response = client.me_response
         if user_response.status_code == 200:
             print(f"Connected to Vimeo as: {user_response.json().get('name')}")
         else:
@@ -68,10 +80,33 @@ def main():
         print(f"ERROR: Could not connect to Vimeo: {e}")
         sys.exit(1)
 
-    # Query each video ID provided
+    # Query all video IDs provided in bulk
     video_ids = sys.argv[1:]
+    try:
+        videos_by_uri = query_videos_bulk(client, video_ids)
+    except Exception as e:
+        print(f"WARNING: Bulk query failed: {e}")
+        videos_by_uri = {}
+
+    # Videos the bulk query didn't return fall back to direct lookups, run
+    # concurrently over the pooled session
+    missing_ids = [video_id for video_id in video_ids if video_uri_for(video_id) not in videos_by_uri]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fallback_results = dict(zip(
+            missing_ids,
+            executor.map(lambda video_id: fetch_video(client, video_id), missing_ids)
+        ))
+
     for video_id in video_ids:
-        query_video(client, video_id)
+        data = videos_by_uri.get(video_uri_for(video_id))
+        if data is None:
+            print_video_result(video_id, fallback_results[video_id])
+            continue
+
+        print(f"\n{'='*80}")
+        print(f"Querying video: {video_id}")
+        print('='*80)
+        print(json.dumps(data, indent=2))
 
 if __name__ == "__main__":
     main()